@@ -623,7 +623,7 @@ def nla_get_flag(nla):
     Returns:
     True if flag is set, otherwise False.
     """
-    return not not nla
+    return bool(nla)
 
 
 def nla_put_msecs(msg, attrtype, msecs):
@@ -712,4 +712,4 @@ def nla_is_nested(attr):
     Returns:
     True if attribute has NLA_F_NESTED flag set, otherwise False.
     """
-    return not not attr.nla_type & NLA_F_NESTED
+    return bool(attr.nla_type & NLA_F_NESTED)
@@ -139,7 +139,7 @@ def genl_family_get_id(family):
     Returns:
     Numeric identifier or 0 if not available.
     """
-    return int(family.gf_id if family.ce_mask & FAMILY_ATTR_ID else GENL_ID_GENERATE)
+    return family.gf_id if family.ce_mask & FAMILY_ATTR_ID else GENL_ID_GENERATE
 
 
 def genl_family_set_id(family, id_):
@@ -9,7 +9,7 @@ of the License.
 """
 
 from libnl.linux_private.netlink import NLMSG_ALIGN, NLMSG_MIN_TYPE
-from libnl.misc import bytearray_ptr, c_uint16, c_uint8, SIZEOF_U16, SIZEOF_U8, Struct
+from libnl.misc import bytearray_ptr, SIZEOF_U16, SIZEOF_U8, Struct
 
 GENL_NAMSIZ = 16  # Length of family name.
 GENL_MIN_ID = NLMSG_MIN_TYPE
@@ -28,7 +28,13 @@ class genlmsghdr(Struct):
     payload -- payload and padding at the end (bytearay).
     """
 
+    __slots__ = ()
     _REPR = '<{0}.{1} cmd={2[cmd]} version={2[version]} reserved={2[reserved]} payload={2[payload]}>'
+    FIELDS = (
+        ('cmd', 'Return command integer.'),
+        ('version', 'Return version integer.'),
+        ('reserved', 'Return reserved integer.'),
+    )
     SIGNATURE = (SIZEOF_U8, SIZEOF_U8, SIZEOF_U16)
     SIZEOF = sum(SIGNATURE)
 
@@ -42,36 +48,6 @@ class genlmsghdr(Struct):
         if reserved is not None:
             self.reserved = reserved
 
-    @property
-    def cmd(self):
-        """Return command integer."""
-        return c_uint8.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @cmd.setter
-    def cmd(self, value):
-        """Command setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_uint8(value or 0))
-
-    @property
-    def version(self):
-        """Return version integer."""
-        return c_uint8.from_buffer(self.bytearray[self._get_slicers(1)]).value
-
-    @version.setter
-    def version(self, value):
-        """Version setter."""
-        self.bytearray[self._get_slicers(1)] = bytearray(c_uint8(value or 0))
-
-    @property
-    def reserved(self):
-        """Return reserved integer."""
-        return c_uint16.from_buffer(self.bytearray[self._get_slicers(2)]).value
-
-    @reserved.setter
-    def reserved(self, value):
-        """Reserved setter."""
-        self.bytearray[self._get_slicers(2)] = bytearray(c_uint16(value or 0))
-
     @property
     def payload(self):
         """Payload and padding at the end (bytearray_ptr)."""
@@ -8,8 +8,8 @@ License as published by the Free Software Foundation version 2.1
 of the License.
 """
 
-from libnl.misc import (bytearray_ptr, c_int, c_uint, c_uint16, c_uint32, c_ushort, SIZEOF_INT, SIZEOF_U16, SIZEOF_U32,
-                        SIZEOF_UINT, SIZEOF_USHORT, Struct)
+from libnl.misc import (bytearray_ptr, c_int, c_uint, SIZEOF_INT, SIZEOF_U16, SIZEOF_U32, SIZEOF_UINT, SIZEOF_USHORT,
+                        Struct)
 
 NETLINK_ROUTE = 0  # Routing/device hook.
 NETLINK_GENERIC = 16
@@ -45,7 +45,14 @@ class sockaddr_nl(Struct):
     nl_groups -- multicast groups mask (c_uint32).
     """
 
+    __slots__ = ()
     _REPR = '<{0}.{1} nl_family={2[nl_family]} nl_pad={2[nl_pad]} nl_pid={2[nl_pid]} nl_groups={2[nl_groups]}>'
+    FIELDS = (
+        ('nl_family', 'AF_NETLINK.'),
+        ('nl_pad', 'Zero.'),
+        ('nl_pid', 'Port ID.'),
+        ('nl_groups', 'Multicast groups mask.'),
+    )
     SIGNATURE = (SIZEOF_UINT, SIZEOF_USHORT, SIZEOF_U32, SIZEOF_U32)
     SIZEOF = sum(SIGNATURE)
 
@@ -62,46 +69,6 @@ class sockaddr_nl(Struct):
         yield self.nl_pid
         yield self.nl_groups
 
-    @property
-    def nl_family(self):
-        """AF_NETLINK."""
-        return c_uint.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @nl_family.setter
-    def nl_family(self, value):
-        """Family setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_uint(value or 0))
-
-    @property
-    def nl_pad(self):
-        """Zero."""
-        return c_ushort.from_buffer(self.bytearray[self._get_slicers(1)]).value
-
-    @nl_pad.setter
-    def nl_pad(self, value):
-        """Pad setter."""
-        self.bytearray[self._get_slicers(1)] = bytearray(c_ushort(value or 0))
-
-    @property
-    def nl_pid(self):
-        """Port ID."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(2)]).value
-
-    @nl_pid.setter
-    def nl_pid(self, value):
-        """Port ID setter."""
-        self.bytearray[self._get_slicers(2)] = bytearray(c_uint32(value or 0))
-
-    @property
-    def nl_groups(self):
-        """Port ID."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(3)]).value
-
-    @nl_groups.setter
-    def nl_groups(self, value):
-        """Group setter."""
-        self.bytearray[self._get_slicers(3)] = bytearray(c_uint32(value or 0))
-
 
 class nlmsghdr(Struct):
     """Netlink message header (holds actual payload of Netlink message).
@@ -124,8 +91,16 @@ class nlmsghdr(Struct):
     payload -- payload and padding at the end (bytearay).
     """
 
+    __slots__ = ()
     _REPR = ('<{0}.{1} nlmsg_len={2[nlmsg_len]} nlmsg_type={2[nlmsg_type]} nlmsg_flags={2[nlmsg_flags]} '
              'nlmsg_seq={2[nlmsg_seq]} nlmsg_pid={2[nlmsg_pid]} payload={2[payload]}>')
+    FIELDS = (
+        ('nlmsg_len', 'Length of message including header.'),
+        ('nlmsg_type', 'Message content.'),
+        ('nlmsg_flags', 'Additional flags.'),
+        ('nlmsg_seq', 'Sequence number.'),
+        ('nlmsg_pid', 'Sending process port ID.'),
+    )
     SIGNATURE = (SIZEOF_U32, SIZEOF_U16, SIZEOF_U16, SIZEOF_U32, SIZEOF_U32)
     SIZEOF = sum(SIGNATURE)
 
@@ -143,56 +118,6 @@ class nlmsghdr(Struct):
         if nlmsg_pid is not None:
             self.nlmsg_pid = nlmsg_pid
 
-    @property
-    def nlmsg_len(self):
-        """Length of message including header."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @nlmsg_len.setter
-    def nlmsg_len(self, value):
-        """Length setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_uint32(value or 0))
-
-    @property
-    def nlmsg_type(self):
-        """Message content."""
-        return c_uint16.from_buffer(self.bytearray[self._get_slicers(1)]).value
-
-    @nlmsg_type.setter
-    def nlmsg_type(self, value):
-        """Message content setter."""
-        self.bytearray[self._get_slicers(1)] = bytearray(c_uint16(value or 0))
-
-    @property
-    def nlmsg_flags(self):
-        """Additional flags."""
-        return c_uint16.from_buffer(self.bytearray[self._get_slicers(2)]).value
-
-    @nlmsg_flags.setter
-    def nlmsg_flags(self, value):
-        """Message flags setter."""
-        self.bytearray[self._get_slicers(2)] = bytearray(c_uint16(value or 0))
-
-    @property
-    def nlmsg_seq(self):
-        """Sequence number."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(3)]).value
-
-    @nlmsg_seq.setter
-    def nlmsg_seq(self, value):
-        """Sequence setter."""
-        self.bytearray[self._get_slicers(3)] = bytearray(c_uint32(value or 0))
-
-    @property
-    def nlmsg_pid(self):
-        """Sending process port ID."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(4)]).value
-
-    @nlmsg_pid.setter
-    def nlmsg_pid(self, value):
-        """Port ID setter."""
-        self.bytearray[self._get_slicers(4)] = bytearray(c_uint32(value or 0))
-
     @property
     def payload(self):
         """Payload and padding at the end (bytearray_ptr)."""
@@ -219,6 +144,7 @@ class nlmsgerr(Struct):
     msg -- nlmsghdr class instance.
     """
 
+    __slots__ = ()
     _REPR = '<{0}.{1} error={2[error]} msg={2[msg]}>'
     SIGNATURE = (SIZEOF_INT, nlmsghdr.SIZEOF)
     SIZEOF = sum(SIGNATURE)
@@ -265,7 +191,9 @@ class nlattr(Struct):
     payload -- payload and padding at the end (bytearay_ptr).
     """
 
+    __slots__ = ()
     _REPR = '<{0}.{1} nla_len={2[nla_len]} nla_type={2[nla_type]} payload={2[payload]}>'
+    FIELDS = (('nla_len', 'Attribute length.'), ('nla_type', 'Attribute type.'))
     SIGNATURE = (SIZEOF_U16, SIZEOF_U16)
     SIZEOF = sum(SIGNATURE)
 
@@ -277,26 +205,6 @@ class nlattr(Struct):
         if nla_type is not None:
             self.nla_type = nla_type
 
-    @property
-    def nla_len(self):
-        """Attribute length."""
-        return c_uint16.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @nla_len.setter
-    def nla_len(self, value):
-        """Length setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_uint16(value or 0))
-
-    @property
-    def nla_type(self):
-        """Attribute type."""
-        return c_uint16.from_buffer(self.bytearray[self._get_slicers(1)]).value
-
-    @nla_type.setter
-    def nla_type(self, value):
-        """Type setter."""
-        self.bytearray[self._get_slicers(1)] = bytearray(c_uint16(value or 0))
-
     @property
     def payload(self):
         """Payload and padding at the end."""
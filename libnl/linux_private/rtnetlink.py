@@ -8,8 +8,7 @@ License as published by the Free Software Foundation version 2.1
 of the License.
 """
 
-from libnl.misc import (bytearray_ptr, c_int, c_ubyte, c_uint, c_ushort, SIZEOF_INT, SIZEOF_UBYTE, SIZEOF_UINT,
-                        SIZEOF_USHORT, Struct)
+from libnl.misc import bytearray_ptr, c_int, SIZEOF_INT, SIZEOF_UBYTE, SIZEOF_UINT, SIZEOF_USHORT, Struct
 
 RTNL_FAMILY_IPMR = 128
 RTNL_FAMILY_IP6MR = 129
@@ -75,7 +74,9 @@ class rtattr(Struct):
     payload -- payload and padding at the end (bytearay).
     """
 
+    __slots__ = ()
     _REPR = '<{0}.{1} rta_len={2[rta_len]} rta_type={2[rta_type]} payload={2[payload]}>'
+    FIELDS = (('rta_len', 'Attribute length.'), ('rta_type', 'Attribute type.'))
     SIGNATURE = (SIZEOF_USHORT, SIZEOF_USHORT)
     SIZEOF = sum(SIGNATURE)
 
@@ -87,26 +88,6 @@ class rtattr(Struct):
         if rta_type is not None:
             self.rta_type = rta_type
 
-    @property
-    def rta_len(self):
-        """Attribute length."""
-        return c_ushort.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @rta_len.setter
-    def rta_len(self, value):
-        """Length setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_ushort(value or 0))
-
-    @property
-    def rta_type(self):
-        """Attribute type."""
-        return c_ushort.from_buffer(self.bytearray[self._get_slicers(1)]).value
-
-    @rta_type.setter
-    def rta_type(self, value):
-        """Type setter."""
-        self.bytearray[self._get_slicers(1)] = bytearray(c_ushort(value or 0))
-
     @property
     def payload(self):
         """Payload and padding at the end."""
@@ -131,7 +112,9 @@ class rtgenmsg(Struct):
     rtgen_family -- rtgen family (c_ubyte).
     """
 
+    __slots__ = ()
     _REPR = '<{0}.{1} rtgen_family={2[rtgen_family]}>'
+    FIELDS = (('rtgen_family', 'rtgen family.'), )
     SIGNATURE = (SIZEOF_UBYTE, )
     SIZEOF = sum(SIGNATURE)
 
@@ -141,16 +124,6 @@ class rtgenmsg(Struct):
         if rtgen_family is not None:
             self.rtgen_family = rtgen_family
 
-    @property
-    def rtgen_family(self):
-        """rtgen family."""
-        return c_ubyte.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @rtgen_family.setter
-    def rtgen_family(self, value):
-        """Family setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_ubyte(value or 0))
-
 
 class ifinfomsg(Struct):
     """Pass link level specific information, not dependent on network protocol.
@@ -167,8 +140,17 @@ class ifinfomsg(Struct):
     payload -- payload and padding at the end (bytearay).
     """
 
+    __slots__ = ()
     _REPR = ('<{0}.{1} ifi_family={2[ifi_family]} ifi_type={2[ifi_type]} ifi_index={2[ifi_index]} '
              'ifi_flags={2[ifi_flags]} ifi_change={2[ifi_change]} payload={2[payload]}>')
+    FIELDS = (
+        ('ifi_family', 'Message family.'),
+        None,
+        ('ifi_type', 'Message type.'),
+        None,
+        ('ifi_flags', 'Message flags.'),
+        ('ifi_change', 'Message change.'),
+    )
     SIGNATURE = (SIZEOF_UBYTE, SIZEOF_UBYTE, SIZEOF_USHORT, SIZEOF_INT, SIZEOF_UINT, SIZEOF_UINT)
     SIZEOF = sum(SIGNATURE)
 
@@ -186,26 +168,6 @@ class ifinfomsg(Struct):
         if ifi_change is not None:
             self.ifi_change = ifi_change
 
-    @property
-    def ifi_family(self):
-        """Message family."""
-        return c_ubyte.from_buffer(self.bytearray[self._get_slicers(0)]).value
-
-    @ifi_family.setter
-    def ifi_family(self, value):
-        """Family setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_ubyte(value or 0))
-
-    @property
-    def ifi_type(self):
-        """Message type."""
-        return c_ushort.from_buffer(self.bytearray[self._get_slicers(2)]).value
-
-    @ifi_type.setter
-    def ifi_type(self, value):
-        """Type setter."""
-        self.bytearray[self._get_slicers(2)] = bytearray(c_ushort(value or 0))
-
     @property
     def ifi_index(self):
         """Message index."""
@@ -216,26 +178,6 @@ class ifinfomsg(Struct):
         """Index setter."""
         self.bytearray[self._get_slicers(3)] = bytearray(c_int(value or 0))
 
-    @property
-    def ifi_flags(self):
-        """Message flags."""
-        return c_uint.from_buffer(self.bytearray[self._get_slicers(4)]).value
-
-    @ifi_flags.setter
-    def ifi_flags(self, value):
-        """Message flags setter."""
-        self.bytearray[self._get_slicers(4)] = bytearray(c_uint(value or 0))
-
-    @property
-    def ifi_change(self):
-        """Message change."""
-        return c_uint.from_buffer(self.bytearray[self._get_slicers(5)]).value
-
-    @ifi_change.setter
-    def ifi_change(self, value):
-        """Change setter."""
-        self.bytearray[self._get_slicers(5)] = bytearray(c_uint(value or 0))
-
     @property
     def payload(self):
         """Payload and padding at the end (bytearray_ptr)."""
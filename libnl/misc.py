@@ -1,6 +1,7 @@
 """Misc code not defined in Netlink but used by it."""
 
 import ctypes
+import re
 import struct
 
 
@@ -67,43 +68,116 @@ c_ulonglong = _class_factory(ctypes.c_ulonglong)
 c_ushort = _class_factory(ctypes.c_ushort)
 sizeof = ctypes.sizeof
 
-SIZEOF_BYTE = sizeof(c_byte)
+SIZEOF_BYTE = 1  # Fixed width, no need to ask ctypes.
 SIZEOF_INT = sizeof(c_int)
 SIZEOF_LONG = sizeof(c_long)  # Platform dependant.
 SIZEOF_LONGLONG = sizeof(c_longlong)
-SIZEOF_S8 = sizeof(c_int8)
-SIZEOF_U16 = sizeof(c_uint16)
-SIZEOF_U32 = sizeof(c_uint32)
-SIZEOF_U64 = sizeof(c_uint64)
-SIZEOF_U8 = sizeof(c_uint8)
-SIZEOF_UBYTE = sizeof(c_ubyte)
+SIZEOF_S8 = 1
+SIZEOF_U16 = 2
+SIZEOF_U32 = 4
+SIZEOF_U64 = 8
+SIZEOF_U8 = 1
+SIZEOF_UBYTE = 1
 SIZEOF_UINT = sizeof(c_uint)
 SIZEOF_ULONG = SIZEOF_POINTER = sizeof(c_ulong)  # Platform dependant.
 SIZEOF_ULONGLONG = sizeof(c_ulonglong)
 SIZEOF_USHORT = sizeof(c_ushort)
 
 
-class _DynamicDict(dict):
-    """A dict to be used in str.format() in Struct."""
+try:
+    bytes().hex(' ')
+except (AttributeError, TypeError):
+    # Python < 3.8, bytes.hex() doesn't exist or doesn't take a separator.
+    def _hex_dump(data):
+        """Return a hex dump (space delimited per byte) of data."""
+        return ' '.join(map('{0:02x}'.format, bytearray(data)))
+else:
+    def _hex_dump(data):
+        """Return a hex dump (space delimited per byte) of data."""
+        return bytes(data).hex(' ')
 
-    def __init__(self, instance):
-        """Constructor."""
-        super(_DynamicDict, self).__init__()
-        self._instance = instance
+_REPR_ATTR_RE = re.compile(r'{2\[(\w+)\]')
+_U8 = struct.Struct('=B')
+_U16 = struct.Struct('=H')
+_U32 = struct.Struct('=I')
+_U64 = struct.Struct('=Q')
+_UNSIGNED_BY_SIZE = {SIZEOF_U8: _U8, SIZEOF_U16: _U16, SIZEOF_U32: _U32, SIZEOF_U64: _U64}
 
-    def __missing__(self, key):
-        """Return dynamic value for 'payload' key."""
-        value = getattr(self._instance, key)
-        if key == 'payload':
-            value = len(value)
-            return '{0}byte{1}'.format(value, '' if value == 1 else 's')
-        return value
 
+def _field_property(offset, packer, doc):
+    """Generate a property that reads/writes an unsigned integer field in place, without slicing or ctypes objects.
+
+    Positional arguments:
+    offset -- byte offset of the field within the struct.
+    packer -- precompiled struct.Struct instance for the field's width.
+    doc -- docstring of the property.
+
+    Returns:
+    property() object.
+    """
+    size = packer.size
+    mask = (1 << (8 * size)) - 1
+
+    def fget(self):
+        ba = self.bytearray
+        if hasattr(ba, 'pointee'):
+            start, length = ba._bounds()
+            ba = ba.pointee
+        else:
+            start, length = 0, len(ba)
+        if length - offset < size:
+            raise ValueError('Buffer size too small ({0} instead of at least {1} bytes)'.format(
+                max(0, length - offset), size))
+        return packer.unpack_from(ba, start + offset)[0]
+
+    def fset(self, value):
+        value = (value or 0) & mask  # Wrap out of range values like ctypes does.
+        ba = self.bytearray
+        if hasattr(ba, 'pointee'):
+            start, length = ba._bounds()
+            pointee = ba.pointee
+        else:
+            start, length, pointee = 0, len(ba), ba
+        if length - offset < size:
+            # Field doesn't fit, let bytearray/bytearray_ptr slice assignment handle it (grow or raise).
+            ba[offset:offset + size] = packer.pack(value)
+            return
+        packer.pack_into(pointee, start + offset, value)
 
-class Struct(object):
+    return property(fget, fset, doc=doc)
+
+
+class _StructMeta(type):
+    """Metaclass for Struct, precomputes slices, field accessors, and repr attributes once per class definition."""
+
+    def __init__(cls, name, bases, namespace):
+        """Constructor."""
+        super(_StructMeta, cls).__init__(name, bases, namespace)
+        slices = list()
+        offset = 0
+        for size in getattr(cls, 'SIGNATURE', ()):
+            slices.append(slice(offset, offset + size))
+            offset += size
+        cls._SLICES = tuple(slices)
+        cls._REPR_ATTRS = tuple(_REPR_ATTR_RE.findall(getattr(cls, '_REPR', '')))
+
+        # Generate accessors for FIELDS ((name, docstring) or None), unless the class body implements them by hand.
+        for index, field in enumerate(namespace.get('FIELDS', ())):
+            if not field or field[0] in namespace:
+                continue
+            field_name, doc = field
+            packer = _UNSIGNED_BY_SIZE.get(cls.SIGNATURE[index])
+            if packer is None:
+                raise TypeError('{0}.{1} is not an unsigned integer field'.format(name, field_name))
+            setattr(cls, field_name, _field_property(slices[index].start, packer, doc))
+
+
+class Struct(_StructMeta('_StructBase', (object, ), dict(__slots__=()))):
     """A base class equivalent to a C struct of a fixed size, holding no pointers in the struct definition."""
 
+    __slots__ = ('bytearray', )
     _REPR = '<{0}.{1}>'
+    FIELDS = ()
     SIGNATURE = ()
     SIZEOF = 0
 
@@ -113,7 +187,7 @@ class Struct(object):
 
     def __bool__(self):
         """Return True if self.bytearray is more than just null bytes."""
-        return not not bytearray(self.bytearray).strip(b'\0')
+        return any(self.bytearray)
 
     def __bytes__(self):
         """Return a bytes object."""
@@ -125,13 +199,22 @@ class Struct(object):
 
     def __repr__(self):
         """Return a repr of the subclass instance with property values."""
-        dynamic_dict = _DynamicDict(self)
-        answer = self._REPR.format(self.__class__.__module__, self.__class__.__name__, dynamic_dict)
-        return answer
+        if not self._REPR_ATTRS:
+            return self._REPR.format(self.__class__.__module__, self.__class__.__name__)
+        values = dict((k, self._repr_value(k)) for k in self._REPR_ATTRS)
+        return self._REPR.format(self.__class__.__module__, self.__class__.__name__, values)
 
     def __str__(self):
         """Return a hex dump (space delimited per byte) of the data."""
-        return ' '.join(format(c, '02x') for c in self.bytearray)
+        return _hex_dump(self.bytearray)
+
+    def _repr_value(self, key):
+        """Return the value of an attribute for use in __repr__(), summarizing 'payload' by its length."""
+        value = getattr(self, key)
+        if key == 'payload':
+            value = len(value)
+            return '{0}byte{1}'.format(value, '' if value == 1 else 's')
+        return value
 
     def _get_slicers(self, index):
         """Return a slice object to slice a list/bytearray by.
@@ -142,67 +225,85 @@ class Struct(object):
         Returns:
         slice() object. E.g. `x = _get_slicers(0); ba_instance[x]`
         """
-        if not index:  # first item.
-            return slice(0, self.SIGNATURE[0])
-        if index >= len(self.SIGNATURE):
-            raise IndexError('index out of self.SIGNATURE range')
-        pad_start = sum(self.SIGNATURE[:index])
-        pad_stop = pad_start + self.SIGNATURE[index]
-        return slice(pad_start, pad_stop)
+        return self._SLICES[index]
 
 
-class ucred(Struct):
+class ucred(ctypes.Structure):
     """Ancillary message for passing credentials.
 
     http://linux.die.net/man/7/unix
     http://stackoverflow.com/questions/1922761/size-of-pid-t-uid-t-gid-t-on-linux
 
+    Backed by a native ctypes Structure instead of a bytearray, so reading/writing fields does not allocate.
+
     Instance variables:
     pid -- process ID of the sending process (c_uint32).
     uid -- user ID of the sending process (c_uint32).
     gid -- group ID of the sending process (c_uint32).
     """
 
-    _REPR = '<{0}.{1} pid={2[pid]} uid={2[uid]} gid={2[uid]}>'
-    SIGNATURE = (SIZEOF_U32, SIZEOF_U32, SIZEOF_U32)
-    SIZEOF = sum(SIGNATURE)
+    _fields_ = [('_pid', ctypes.c_uint32), ('_uid', ctypes.c_uint32), ('_gid', ctypes.c_uint32)]
+    _REPR = '<{0}.{1} pid={2.pid} uid={2.uid} gid={2.gid}>'
+    SIZEOF = SIZEOF_U32 * 3
 
     def __init__(self, pid=0, uid=0, gid=0):
         """Constructor."""
-        super(ucred, self).__init__()
-        self.pid = pid
-        self.uid = uid
-        self.gid = gid
+        super(ucred, self).__init__(pid or 0, uid or 0, gid or 0)
+
+    def __bool__(self):
+        """Return True if any field is non-zero."""
+        return bool(self.pid or self.uid or self.gid)
+
+    def __bytes__(self):
+        """Return a bytes object."""
+        return ctypes.string_at(ctypes.addressof(self), ctypes.sizeof(self))
+
+    def __nonzero__(self):
+        """Python 2.x compatibility."""
+        return self.__bool__()
+
+    def __repr__(self):
+        """Return a repr of the instance with field values."""
+        return self._REPR.format(self.__class__.__module__, self.__class__.__name__, self)
+
+    def __str__(self):
+        """Return a hex dump (space delimited per byte) of the data."""
+        return _hex_dump(self.bytearray)
+
+    @property
+    def bytearray(self):
+        """Copy of the struct's raw bytes (bytearray). Changes to it do not propagate back."""
+        return bytearray(self.__bytes__())
 
     @property
     def pid(self):
         """Process ID of the sending process."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(0)]).value
+        return self._pid
 
     @pid.setter
     def pid(self, value):
         """Process ID setter."""
-        self.bytearray[self._get_slicers(0)] = bytearray(c_int32(value or 0))
+        self._pid = value or 0
 
     @property
     def uid(self):
         """User ID of the sending process."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(1)]).value
+        return self._uid
 
     @uid.setter
     def uid(self, value):
         """User ID setter."""
-        self.bytearray[self._get_slicers(1)] = bytearray(c_int32(value or 0))
+        self._uid = value or 0
 
     @property
     def gid(self):
         """Group ID of the sending process."""
-        return c_uint32.from_buffer(self.bytearray[self._get_slicers(2)]).value
+        return self._gid
 
     @gid.setter
     def gid(self, value):
         """Group ID setter."""
-        self.bytearray[self._get_slicers(2)] = bytearray(c_int32(value or 0))
+        self._gid = value or 0
 
 
 class msghdr(object):
@@ -217,6 +318,8 @@ class msghdr(object):
     msg_flags -- flags on received message.
     """
 
+    __slots__ = ('msg_name', 'msg_iov', 'msg_control', 'msg_flags')
+
     def __init__(self, msg_name=None, msg_iov=None, msg_control=None, msg_flags=0):
         """Constructor."""
         self.msg_name = msg_name
@@ -258,6 +361,8 @@ class bytearray_ptr(object):
     oob -- go out of bounds with negative start/stop values.
     """
 
+    __slots__ = ('pointee', 'slice')
+
     def __init__(self, pointee, start=None, stop=None, oob=False):
         """Constructor."""
         # Hard-code borders.
@@ -279,22 +384,38 @@ class bytearray_ptr(object):
 
     def __repr__(self):
         """Make this class' repr() look similar to bytearray's."""
-        return "{0}(b'{1}')".format(self.__class__.__name__, ''.join(r'\x{0:02x}'.format(c) for c in bytearray(self)))
+        return "{0}(b'{1}')".format(self.__class__.__name__, ''.join(map(r'\x{0:02x}'.format, bytearray(self))))
 
     def __delitem__(self, key):
         """Raise TypeError on delete attempt."""
         raise TypeError("'{0}' object doesn't support item deletion".format(self.__class__.__name__))
 
     def __getitem__(self, item):
-        """Handle indexing."""
-        return self.pointee[self.slice][item]
+        """Handle indexing by translating the key into the pointee's coordinates (no intermediate copy)."""
+        start, length = self._bounds()
+        if isinstance(item, slice):
+            item_start, item_stop, step = item.indices(length)
+            if step != 1:
+                return self.pointee[start:start + length][item]
+            return self.pointee[start + item_start:start + max(item_start, item_stop)]
+        if item < 0:
+            item += length
+        if not 0 <= item < length:
+            raise IndexError('{0} index out of range'.format(self.__class__.__name__))
+        return self.pointee[start + item]
+
+    def __iter__(self):
+        """Iterate over a single copy of the referenced bytes instead of calling __getitem__() once per byte."""
+        return iter(self[:])
 
     def __len__(self):
         """Implement length of class instance."""
-        return len(self.pointee[self.slice])
+        return self._bounds()[1]
 
     def __setitem__(self, key, value):
         """Set value in the correct index of the parent bytearray."""
+        self_len = self._bounds()[1]
+
         # Handle integer keys (lookup).
         try:
             int(key)
@@ -303,26 +424,28 @@ class bytearray_ptr(object):
         else:
             key_is_int = True
             if key < 0:
-                key += len(self)
+                key += self_len
             key = slice(key, key + 1)
 
         # Calculate slices.
         start = key.start or 0
         if start < 0:
-            start += len(self)
-        if start >= len(self):
+            start += self_len
+        if start >= self_len:
             raise IndexError('{0} index out of range'.format(self.__class__.__name__))
-        stop = key.stop or (start if key.stop == 0 else len(self))
+        stop = key.stop or (start if key.stop == 0 else self_len)
         if stop < 0:
-            stop += len(self)
+            stop += self_len
         start += self.slice.start
         stop += self.slice.start
         stop = min(stop, self.slice.stop)
 
         # Catch invalid length.
         original_length = len(self.pointee)
-        if not key_is_int and len(self.pointee[start:stop]) != len(value):
-            raise TypeError("length of '{0}' object cannot be changed".format(self.__class__.__name__))
+        if not key_is_int:
+            target_start, target_stop = slice(start, stop).indices(original_length)[:2]
+            if max(0, target_stop - target_start) != len(value):
+                raise TypeError("length of '{0}' object cannot be changed".format(self.__class__.__name__))
 
         # Handle slices.
         if key_is_int:
@@ -330,13 +453,23 @@ class bytearray_ptr(object):
         else:
             self.pointee[start:stop] = value
 
-        # Catch bugs.
-        if len(self.pointee) != original_length:
-            raise RuntimeError('Bug in {0} found! Please report this.'.format(self.__class__.__name__))
+        # Catch bugs (compiled out with python -O).
+        if __debug__:
+            if len(self.pointee) != original_length:
+                raise RuntimeError('Bug in {0} found! Please report this.'.format(self.__class__.__name__))
+
+    def _bounds(self):
+        """Return the start index in the pointee and the length of the referenced data.
+
+        Both are resolved against the pointee's current length, same as slicing it with self.slice would.
+        """
+        start, stop = self.slice.indices(len(self.pointee))[:2]
+        return start, max(0, stop - start)
 
     def copy(self):
         """Create a bytearray instance (new bytearray pointing to same data)."""
-        return bytearray(self.pointee[self.slice])
+        data = self[:]
+        return data if isinstance(data, bytearray) else bytearray(data)
 
 
 def get_string(stream):
@@ -350,9 +483,4 @@ def get_string(stream):
     Returns:
     bytes() instance of any characters from the start of the stream until before the first null byte.
     """
-    ba = bytearray()
-    for c in stream:
-        if not c:
-            break
-        ba.append(c)
-    return bytes(ba)
+    return bytes(bytearray(stream).partition(b'\0')[0])
@@ -66,7 +66,7 @@ def get_mcs_index(mcs):
     for mcs_bit in range(77):
         mcs_octet = int(mcs_bit / 8)
         mcs_rate_bit = 1 << mcs_bit % 8
-        mcs_rate_idx_set = not not (mcs[mcs_octet] & mcs_rate_bit)
+        mcs_rate_idx_set = bool(mcs[mcs_octet] & mcs_rate_bit)
         if not mcs_rate_idx_set:
             continue
         answers.append(mcs_bit)
@@ -139,10 +139,10 @@ def get_ht_mcs(mcs):
     """
     answers = dict()
     max_rx_supp_data_rate = (mcs[10] & ((mcs[11] & 0x3) << 8))
-    tx_mcs_set_defined = not not (mcs[12] & (1 << 0))
+    tx_mcs_set_defined = bool(mcs[12] & (1 << 0))
     tx_mcs_set_equal = not (mcs[12] & (1 << 1))
     tx_max_num_spatial_streams = ((mcs[12] >> 2) & 3) + 1
-    tx_unequal_modulation = not not (mcs[12] & (1 << 4))
+    tx_unequal_modulation = bool(mcs[12] & (1 << 4))
 
     if max_rx_supp_data_rate:
         answers['HT Max RX data rate (Mbps)'] = max_rx_supp_data_rate
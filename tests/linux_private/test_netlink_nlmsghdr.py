@@ -4,9 +4,11 @@ import base64
 import socket
 import sys
 
+import pytest
+
 from libnl.attr import nla_put_u32, nla_put_u64
-from libnl.linux_private.netlink import NETLINK_ROUTE
-from libnl.misc import msghdr
+from libnl.linux_private.netlink import NETLINK_ROUTE, nlmsghdr
+from libnl.misc import bytearray_ptr, msghdr
 from libnl.msg import nlmsg_alloc, nlmsg_hdr
 from libnl.nl import nl_complete_msg, nl_connect, nl_sendmsg
 from libnl.socket_ import nl_socket_alloc, nl_socket_free
@@ -140,3 +142,38 @@ def test_two_attrs():
 
     expected = b'JAAAAAAABQAAAAAAAAAAAAgABAAIAAAADAAFABEAAAAAAAAA'
     assert expected == base64.b64encode(buffer(nlh.bytearray[:nlh.nlmsg_len]))
+
+
+def test_wrap():
+    """Test out of range values wrap around like C unsigned integers."""
+    nlh = nlmsghdr(nlmsg_seq=2 ** 32 + 5, nlmsg_pid=-1, nlmsg_type=None)
+    assert 5 == nlh.nlmsg_seq
+    assert 4294967295 == nlh.nlmsg_pid
+    assert 0 == nlh.nlmsg_type
+    assert 'Sequence number.' == nlmsghdr.nlmsg_seq.__doc__
+
+
+def test_bounded():
+    """Test fields of a header backed by bytearray_ptr instances that are too short or offset."""
+    buf = bytearray(range(1, 21))
+    nlh = nlmsghdr(bytearray_ptr(buf, 0, 6))
+    assert nlmsghdr(bytearray(range(1, 21))).nlmsg_len == nlh.nlmsg_len
+    with pytest.raises(ValueError):
+        assert nlh.nlmsg_flags
+    with pytest.raises(ValueError):
+        assert nlh.nlmsg_seq
+    with pytest.raises(IndexError):
+        nlh.nlmsg_seq = 0
+    with pytest.raises(TypeError):
+        nlmsghdr(bytearray_ptr(buf, 0, 10)).nlmsg_seq = 0
+    assert bytearray(range(1, 21)) == buf
+
+    nlh = nlmsghdr(bytearray_ptr(buf, 4))
+    nlh.nlmsg_len = 0
+    nlh.nlmsg_pid = 0
+    assert 0 == nlh.nlmsg_len
+    assert 0 == nlh.nlmsg_pid
+    assert bytearray([1, 2, 3, 4, 0, 0, 0, 0]) + bytearray(range(9, 17)) + bytearray(4) == buf
+
+    with pytest.raises(ValueError):
+        assert nlmsghdr(bytearray(10)).nlmsg_seq
@@ -0,0 +1,35 @@
+"""Tests for libnl/misc:ucred."""
+
+from libnl.misc import ucred
+
+
+def test_fields():
+    """Test getters, setters, and the raw byte representation."""
+    creds = ucred()
+    assert not creds
+    assert bytearray(b'\0') * 12 == creds.bytearray
+
+    creds = ucred(pid=1, uid=2, gid=3)
+    assert creds
+    assert (1, 2, 3) == (creds.pid, creds.uid, creds.gid)
+    assert bytearray(b'\x01\0\0\0\x02\0\0\0\x03\0\0\0') == creds.bytearray
+    assert '01 00 00 00 02 00 00 00 03 00 00 00' == str(creds)
+    assert '<libnl.misc.ucred pid=1 uid=2 gid=3>' == repr(creds)
+
+    creds.gid = -1
+    creds.pid = None
+    assert (0, 2, 4294967295) == (creds.pid, creds.uid, creds.gid)
+    assert bytearray(b'\0\0\0\0\x02\0\0\0\xff\xff\xff\xff') == creds.bytearray
+
+    creds = ucred(None, None, None)
+    assert (0, 0, 0) == (creds.pid, creds.uid, creds.gid)
+
+
+def test_bytearray_is_copy():
+    """Test that ucred.bytearray is a detached copy, edits to it don't change the struct."""
+    creds = ucred(pid=1)
+    ba = creds.bytearray
+    ba[0] = 9
+    assert 1 == creds.pid
+    assert bytearray(b'\x01') + bytearray(11) == creds.bytearray
+    assert ba is not creds.bytearray